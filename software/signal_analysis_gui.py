@@ -1,8 +1,22 @@
 import sys
 import json
 import csv
+
+try:
+    # Optional C-extension JSON parser; 3-5x faster on the hot paths
+    # (serial ingest and replay loading). Falls back to stdlib json.
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+import re
 import time
 import random
+import itertools
+import operator
+import threading
+from functools import lru_cache, partial, reduce
+from collections import deque
 import numpy as np
 import serial
 import serial.tools.list_ports
@@ -13,9 +27,18 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
                              QDialog, QFormLayout, QDialogButtonBox, QColorDialog, QGridLayout,
                              QMenuBar, QMenu, QToolBar, QLineEdit, QListWidget, QSizePolicy)
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThread, QObject, QPoint, QRect
-from PyQt6.QtGui import QColor, QPalette, QFont, QAction, QPainter, QBrush, QPen, QRadialGradient, QLinearGradient, QConicalGradient, QTransform
+from PyQt6.QtGui import QColor, QPalette, QFont, QAction, QPainter, QBrush, QPen, QRadialGradient, QLinearGradient, QConicalGradient, QTransform, QPixmap
 import pyqtgraph as pg
 
+try:
+    # Route curve painting through the GPU line-strip path when PyOpenGL
+    # is available; the CPU QPainterPath renderer is the bottleneck with
+    # many curves at 30 Hz
+    import OpenGL  # noqa: F401
+    pg.setConfigOptions(useOpenGL=True, enableExperimental=False)
+except ImportError:
+    pass
+
 # ==========================================
 # Constants & Configuration
 # ==========================================
@@ -48,7 +71,22 @@ COLOR_ACCENT_3 = THEMES["Dark"]["accent3"]
 COLOR_ACCENT_4 = THEMES["Dark"]["accent4"]
 COLOR_ACCENT_5 = THEMES["Dark"]["accent5"]
 
+@lru_cache(maxsize=64)
+def _make_pen(color, width, style):
+    # Identical (color, width, style) triples share one QPen; pyqtgraph
+    # never mutates the pens it is handed
+    return pg.mkPen(color, width=width, style=style)
+
+
 def get_stylesheet(theme):
+    # Memoized on the theme contents: swapping back to an already-built
+    # theme skips the ~40 f-string substitutions below
+    return _build_stylesheet(tuple(sorted(theme.items())))
+
+
+@lru_cache(maxsize=4)
+def _build_stylesheet(theme_items):
+    theme = dict(theme_items)
     return f"""
     QMainWindow {{
         background-color: {theme['bg']};
@@ -148,9 +186,146 @@ def get_stylesheet(theme):
     }}
     """
 
+# ==========================================
+# Data Buffers
+# ==========================================
+class RingBuffer:
+    """Fixed-capacity ring buffer backed by a preallocated NumPy array.
+
+    Covers the small slice of the deque API the GUI uses (append, extend,
+    len, truthiness, clear) while letting readers pull the newest n
+    samples as one contiguous float array with no per-element boxing.
+    """
+
+    def __init__(self, capacity, dtype=np.float32):
+        self._buf = np.empty(capacity, dtype=dtype)
+        self._cap = capacity
+        self._head = 0   # next write slot
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % self._cap
+        if self._count < self._cap:
+            self._count += 1
+
+    def extend(self, values):
+        arr = np.asarray(values, dtype=self._buf.dtype)
+        n = len(arr)
+        if n >= self._cap:
+            self._buf[:] = arr[-self._cap:]
+            self._head = 0
+            self._count = self._cap
+            return
+        end = self._head + n
+        if end <= self._cap:
+            self._buf[self._head:end] = arr
+        else:
+            split = self._cap - self._head
+            self._buf[self._head:] = arr[:split]
+            self._buf[:end - self._cap] = arr[split:]
+        self._head = end % self._cap
+        self._count = min(self._count + n, self._cap)
+
+    def last(self):
+        if not self._count:
+            return 0.0
+        return float(self._buf[(self._head - 1) % self._cap])
+
+    def tail(self, n):
+        """Newest n samples, oldest first. A zero-copy view whenever the
+        data is contiguous; a single C-level copy when it wraps."""
+        n = min(n, self._count)
+        if n <= 0:
+            return self._buf[:0]
+        start = (self._head - n) % self._cap
+        end = start + n
+        if end <= self._cap:
+            return self._buf[start:end]
+        out = np.empty(n, dtype=self._buf.dtype)
+        split = self._cap - start
+        out[:split] = self._buf[start:]
+        out[split:] = self._buf[:end - self._cap]
+        return out
+
+    def asarray(self):
+        return self.tail(self._count)
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+
 # ==========================================
 # Serial Worker
 # ==========================================
+
+# One C-level match replaces the split/startswith/endswith chain and
+# rejects malformed lines in a single pass
+_FRAME_RE = re.compile(rb'^(\{.*\})\|([0-9A-Fa-f]+)$')
+
+# The checksum field is 1-2 hex chars; a dict hit beats generic int(s, 16)
+_HEX_LUT = {f'{i:02x}'.encode(): i for i in range(256)}
+_HEX_LUT.update({f'{i:02X}'.encode(): i for i in range(256)})
+_HEX_LUT.update({f'{i:x}'.encode(): i for i in range(16)})
+_HEX_LUT.update({f'{i:X}'.encode(): i for i in range(16)})
+
+
+def _parse_frames(lines, _match=_FRAME_RE.match, _hex=_HEX_LUT.get,
+                  _xor=operator.xor, _reduce=reduce, _loads=None):
+    """Parse verified (data, raw_text) frames out of raw byte lines.
+
+    The whole per-line pipeline lives in one free function with the hot
+    names pre-bound as locals, keeping the inner loop free of attribute
+    lookups. This is also the loop that would move to a compiled
+    extension if the project ever grows a build step.
+    """
+    if _loads is None:
+        _loads = json_loads
+    # Pre-sized: almost every line is a valid frame in steady state, so
+    # fill by index instead of growing via append
+    batch = [None] * len(lines)
+    count = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        m = _match(line)
+        if not m:
+            continue
+        body, chk_b = m.group(1), m.group(2)
+
+        recv_chk = _hex(chk_b)
+        if recv_chk is None:
+            # Mixed-case or overlong field
+            recv_chk = int(chk_b, 16)
+        if len(body) < 64:
+            # NumPy setup cost dominates below ~64 bytes; iterating
+            # bytes yields ints directly
+            calc_chk = _reduce(_xor, body, 0)
+        else:
+            calc_chk = int(np.bitwise_xor.reduce(
+                np.frombuffer(body, dtype=np.uint8)))
+        if calc_chk != recv_chk:
+            continue
+
+        try:
+            data = _loads(body)
+            # Keep the verified raw text so the recorder can write it
+            # verbatim without re-serializing; decode only frames that
+            # passed the checksum
+            batch[count] = (data, body.decode('utf-8', errors='ignore'))
+            count += 1
+        except (json.JSONDecodeError, ValueError):
+            pass
+    del batch[count:]
+    return batch
+
+
 class SerialWorker(QThread):
     data_received = pyqtSignal(list)
     raw_received = pyqtSignal(list)
@@ -162,75 +337,82 @@ class SerialWorker(QThread):
         self.baud = baud
         self.running = True
         self.ser = None
-        self.pending_commands = []
-        self.read_buffer = ""
+        self.pending_commands = deque()
+        self._cmd_lock = threading.Lock()
+        self.read_buffer = bytearray()
+        # Reused receive buffer: readinto() fills it in place instead of
+        # pyserial allocating a fresh bytes object per drain
+        self._rxbuf = bytearray(65536)
+        self._rxview = memoryview(self._rxbuf)
+        # Raw console feed: keep only the newest lines and emit at ~20 Hz
+        self._raw_ring = deque(maxlen=100)
+        self._last_raw_emit = 0.0
+        # Parsed frames are coalesced to one cross-thread signal per ~16 ms;
+        # each queued emission costs a malloc+mutex on the Qt side
+        self._pending_batch = []
+        self._last_batch_emit = 0.0
 
     def run(self):
         try:
-            self.ser = serial.Serial(self.port, self.baud, timeout=0, dsrdtr=False)
-            
+            self.ser = serial.Serial(self.port, self.baud, timeout=0.05, dsrdtr=False)
+
             while self.running and self.ser.is_open:
-                while self.pending_commands:
-                    cmd = self.pending_commands.pop(0)
-                    self.ser.write((cmd + '\n').encode())
-
-                if self.ser.in_waiting:
-                    try:
-                        raw_data = self.ser.read(self.ser.in_waiting)
-                        text_data = raw_data.decode('utf-8', errors='ignore')
-                        
-                        self.read_buffer += text_data
-                        
-                        if '\n' in self.read_buffer:
-                            lines = self.read_buffer.split('\n')
-                            self.read_buffer = lines.pop()
-                            
-                            batch_data = []
-                            raw_lines_to_emit = lines[-20:] if len(lines) > 20 else lines
-                            
-                            for line in lines:
-                                line = line.strip()
-                                if not line:
-                                    continue
-                                
-                                payload_str = line
-                                valid_payload = False
-                                
-                                if '|' in line:
-                                    parts = line.rsplit('|', 1)
-                                    if len(parts) == 2:
-                                        content, chk_hex = parts
-                                        try:
-                                            chk_hex = chk_hex.strip()
-                                            recv_chk = int(chk_hex, 16)
-                                            calc_chk = 0
-                                            for char in content:
-                                                calc_chk ^= ord(char)
-                                            if calc_chk == recv_chk:
-                                                payload_str = content
-                                                valid_payload = True
-                                        except ValueError:
-                                            pass
-                                else:
-                                    valid_payload = False
-
-                                if valid_payload and payload_str.startswith('{') and payload_str.endswith('}'):
-                                    try:
-                                        data = json.loads(payload_str)
-                                        batch_data.append(data)
-                                    except json.JSONDecodeError:
-                                        pass
-                            
-                            if batch_data:
-                                self.data_received.emit(batch_data)
+                if self.pending_commands:
+                    with self._cmd_lock:
+                        cmds = list(self.pending_commands)
+                        self.pending_commands.clear()
+                    # One write() syscall for the whole queue
+                    self.ser.write(b''.join((c + '\n').encode() for c in cmds))
+
+                # Reads stay outside any blanket except: port errors
+                # (device unplugged) must reach the outer handler so the
+                # UI gets error_occurred and disconnects.
+                # Block up to the 50 ms timeout for the first byte,
+                # then drain whatever else arrived: no idle spin and
+                # no 1 ms sleep floor on latency
+                want = max(1, min(self.ser.in_waiting, len(self._rxbuf)))
+                n = self.ser.readinto(self._rxview[:want])
+                if not n:
+                    # Stream paused: flush whatever is still coalesced
+                    # so trailing samples don't sit in the worker
+                    if self._pending_batch:
+                        self._last_batch_emit = time.monotonic()
+                        self.data_received.emit(self._pending_batch)
+                        self._pending_batch = []
+                    continue
+                # bytearray += is an in-place extend: amortized O(1)
+                # instead of reallocating the whole buffer per read
+                self.read_buffer += self._rxview[:n]
+
+                try:
+                    # Only the parse/emit work may fail soft
+                    idx = self.read_buffer.rfind(b'\n')
+                    if idx >= 0:
+                        chunk = bytes(self.read_buffer[:idx])
+                        del self.read_buffer[:idx + 1]
+                        lines = chunk.split(b'\n')
+
+                        self._raw_ring.extend(lines)
+                        batch_data = _parse_frames(lines)
+
+                        if batch_data:
+                            self._pending_batch.extend(batch_data)
+
+                        now = time.monotonic()
+                        if self._pending_batch and now - self._last_batch_emit > 0.016:
+                            self._last_batch_emit = now
+                            self.data_received.emit(self._pending_batch)
+                            self._pending_batch = []
+
+                        if self._raw_ring and now - self._last_raw_emit > 0.05:
+                            self._last_raw_emit = now
+                            # Emit bytes; the GUI decodes only the lines it
+                            # actually displays
+                            self.raw_received.emit(list(self._raw_ring))
+                            self._raw_ring.clear()
                             
-                            if raw_lines_to_emit:
-                                self.raw_received.emit(raw_lines_to_emit)
-                                
-                    except Exception:
-                        pass
-                else:
-                    self.msleep(1)
+                except Exception:
+                    pass
                     
         except Exception as e:
             if self.running:
@@ -243,7 +425,8 @@ class SerialWorker(QThread):
                 pass
 
     def send_command(self, cmd):
-        self.pending_commands.append(cmd)
+        with self._cmd_lock:
+            self.pending_commands.append(cmd)
 
     def stop(self):
         self.running = False
@@ -401,19 +584,26 @@ class PlotSettingsWidget(QGroupBox):
         h_dc.addWidget(self.spin_dc_range)
         self.layout.addLayout(h_dc)
         
+        # Debounce manual Y-range edits: apply once the user pauses
+        # typing instead of recomputing the range per keystroke
+        self._range_timer = QTimer(self)
+        self._range_timer.setSingleShot(True)
+        self._range_timer.setInterval(120)
+        self._range_timer.timeout.connect(self.update_manual)
+
         # Manual Range
         h_man = QHBoxLayout()
         self.spin_min = QSpinBox()
         self.spin_min.setRange(-10000, 10000)
         self.spin_min.setValue(-10)
         self.spin_min.setEnabled(False)
-        self.spin_min.valueChanged.connect(self.update_manual)
-        
+        self.spin_min.valueChanged.connect(self._schedule_manual)
+
         self.spin_max = QSpinBox()
         self.spin_max.setRange(-10000, 10000)
         self.spin_max.setValue(10)
         self.spin_max.setEnabled(False)
-        self.spin_max.valueChanged.connect(self.update_manual)
+        self.spin_max.valueChanged.connect(self._schedule_manual)
         
         h_man.addWidget(self.spin_min)
         h_man.addWidget(self.spin_max)
@@ -445,6 +635,11 @@ class PlotSettingsWidget(QGroupBox):
                 self.spin_max.setEnabled(True)
                 self.update_manual()
                 
+    def _schedule_manual(self, _value=None):
+        # valueChanged carries the new int; QTimer.start(int) would
+        # interpret it as an interval, hence this shim
+        self._range_timer.start()
+
     def update_manual(self):
         if not self.chk_auto.isChecked() and not self.chk_center.isChecked():
             mn = self.spin_min.value()
@@ -453,10 +648,13 @@ class PlotSettingsWidget(QGroupBox):
                 self.plot.setYRange(mn, mx)
 
     def apply_dc_center(self, values):
-        if self.chk_center.isChecked() and values:
-            avg = np.mean(values)
-            rng = self.spin_dc_range.value()
-            self.plot.setYRange(avg - rng, avg + rng, padding=0)
+        if self.chk_center.isChecked() and len(values):
+            self.center_on_value(float(np.mean(values)))
+
+    def center_on_value(self, avg):
+        """Center the Y range on a mean the caller already computed."""
+        rng = self.spin_dc_range.value()
+        self.plot.setYRange(avg - rng, avg + rng, padding=0)
 
 class LampWidget(QWidget):
     """Industrial-style indicator lamp widget"""
@@ -465,23 +663,63 @@ class LampWidget(QWidget):
         self.name = name
         self.base_color = QColor(color)
         self.active = False
+        # The artwork only depends on (size, color, name, active), so each
+        # state is rasterized once and repaints are a single pixmap blit
+        self._pix_on = None
+        self._pix_off = None
+        self._font = QFont("Arial", 8)
+        self._font.setBold(True)
         self.setMinimumSize(130, 150)
         self.setMaximumSize(130, 150)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        
+
     def set_status(self, active):
         if self.active != active:
             self.active = active
             self.update()
 
+    def invalidate_cache(self):
+        self._pix_on = None
+        self._pix_off = None
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.invalidate_cache()
+
     def paintEvent(self, event):
+        # Qt can dispatch paints during show-up/partial exposure even
+        # when nothing is actually visible
+        if event.region().isEmpty() or not self.isVisible():
+            return
+        if self._pix_on is None:
+            self._render_cache()
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pix_on if self.active else self._pix_off)
+        painter.end()
+
+    def _render_cache(self):
+        # Render at device resolution so HiDPI displays get the same
+        # crisp artwork as direct painting did
+        dpr = self.devicePixelRatioF()
+        w = round(self.width() * dpr)
+        h = round(self.height() * dpr)
+        self._pix_on = QPixmap(w, h)
+        self._pix_on.setDevicePixelRatio(dpr)
+        self._pix_on.fill(Qt.GlobalColor.transparent)
+        self._paint_lamp(self._pix_on, True)
+        self._pix_off = QPixmap(w, h)
+        self._pix_off.setDevicePixelRatio(dpr)
+        self._pix_off.fill(Qt.GlobalColor.transparent)
+        self._paint_lamp(self._pix_off, False)
+
+    def _paint_lamp(self, target, active):
+        painter = QPainter(target)
         try:
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            
+
             w = self.width()
             h = self.height()
-            
+
             # Lamp layout parameters
             cx = w // 2
             cy = 55  # Fixed from top
@@ -507,7 +745,7 @@ class LampWidget(QWidget):
             painter.drawEllipse(QPoint(cx, cy), lamp_radius + 2, lamp_radius + 2)
             
             # === LAMP LENS/BULB ===
-            if self.active:
+            if active:
                 # ACTIVE STATE: Bright, glowing
                 # Inner hotspot gradient
                 bulb_grad = QRadialGradient(cx - 8, cy - 8, lamp_radius * 1.8)
@@ -554,7 +792,7 @@ class LampWidget(QWidget):
             hi_y = int(cy - lamp_radius * 0.5)
             
             highlight_grad = QLinearGradient(hi_x, hi_y, hi_x, hi_y + hi_h)
-            c_high = QColor(255, 255, 255, 150 if self.active else 80)
+            c_high = QColor(255, 255, 255, 150 if active else 80)
             c_trans = QColor(255, 255, 255, 0)
             highlight_grad.setColorAt(0.0, c_high)
             highlight_grad.setColorAt(1.0, c_trans)
@@ -599,11 +837,7 @@ class LampWidget(QWidget):
             # Label text (engraved look with shadow)
             # Shadow
             painter.setPen(QColor("#0a0a0a"))
-            font = painter.font()
-            font.setFamily("Arial")
-            font.setBold(True)
-            font.setPointSize(8)
-            painter.setFont(font)
+            painter.setFont(self._font)
             shadow_rect = label_rect.adjusted(1, 1, 1, 1)
             painter.drawText(shadow_rect, Qt.AlignmentFlag.AlignCenter, self.name)
             
@@ -670,39 +904,51 @@ class LampPanel(QWidget):
         main_layout.addWidget(lamp_container, stretch=1)
         
         self.lamps = {}  # id -> LampWidget
-        
+        self._positions = {}  # id -> (row, col) currently occupied
+
     def update_lamps(self, thresholds, active_ids):
-        # Remove old lamps not in thresholds
+        # This runs every update tick, so in the common case (stable
+        # threshold list) it must not touch the grid layout at all
         current_ids = set(t['id'] for t in thresholds)
         for lid in list(self.lamps.keys()):
             if lid not in current_ids:
                 self.layout.removeWidget(self.lamps[lid])
                 self.lamps[lid].deleteLater()
                 del self.lamps[lid]
-        
-        # Add/Update lamps in grid
+                self._positions.pop(lid, None)
+
         row, col = 0, 0
         max_cols = 4
-        
-        for i, thresh in enumerate(thresholds):
+
+        for thresh in thresholds:
             lid = thresh['id']
-            
+
             if lid not in self.lamps:
                 lamp = LampWidget(thresh['name'], thresh['color'])
                 self.lamps[lid] = lamp
             else:
-                # Update existing lamp properties
-                self.lamps[lid].name = thresh['name']
-                self.lamps[lid].base_color = QColor(thresh['color'])
-            
-            # Position in grid
-            self.layout.addWidget(self.lamps[lid], row, col)
+                # Update existing lamp properties; only touch them when
+                # they changed so the pixmap cache survives
+                lamp = self.lamps[lid]
+                new_color = QColor(thresh['color'])
+                if lamp.name != thresh['name'] or lamp.base_color != new_color:
+                    lamp.name = thresh['name']
+                    lamp.base_color = new_color
+                    lamp.invalidate_cache()
+                    lamp.update()
+
+            # Re-add to the grid only when the slot actually changed;
+            # addWidget on an unchanged lamp still invalidates the layout
+            pos = (row, col)
+            if self._positions.get(lid) != pos:
+                self.layout.addWidget(self.lamps[lid], row, col)
+                self._positions[lid] = pos
             col += 1
             if col >= max_cols:
                 col = 0
                 row += 1
-            
-            # Update lamp status (on/off)
+
+            # Update lamp status (on/off); set_status short-circuits
             self.lamps[lid].set_status(lid in active_ids)
 
 class ThresholdEditorDialog(QDialog):
@@ -790,17 +1036,43 @@ class AdaptiveGripperGUI(QMainWindow):
         
         # Data Storage
         self.buffer_size = 50000
-        self.data = {
-            'mlx': [], 'mly': [], 'mlz': [], 'mag': [], 
-            'mhx': [], 'mhy': [], 'mhz': [],
-            'rmx': [], 'rmy': [], 'rmz': [],
-            'cur': [], 'slip': [], 's_ind': [],
-            'srv': [], 'grp': [],
-            'timestamp': [], 'recv_ts': []
-        }
+        # Preallocated NumPy rings: O(1) append with free eviction, and
+        # plotting/FFT/mean consumers slice contiguous float arrays
+        # instead of re-boxing Python containers
+        data_keys = ['mlx', 'mly', 'mlz', 'mag',
+                     'mhx', 'mhy', 'mhz',
+                     'rmx', 'rmy', 'rmz',
+                     'cur', 'slip', 's_ind',
+                     'srv', 'grp',
+                     'timestamp', 'recv_ts']
+        self.data = {k: RingBuffer(self.buffer_size,
+                                   dtype=np.float64 if k in ('timestamp', 'recv_ts')
+                                   else np.float32)
+                     for k in data_keys}
         self.spike_buffer = {k: [] for k in self.data.keys() if k != 'timestamp'}
         
         self.fft_data = {'freqs': [], 'mags': [], 'freq_resolution': 1.0, 'fft_size': 0}
+        self._freq_axis_cache = {}  # (sample_rate, num_bins) -> ndarray
+        self._mags_buf = None
+        self._last_fft_cfg = None
+        self._fft_tick_cache = {}  # (axis id, bins, res, flag) -> tick lists
+        self._hann = None  # Hann window for the last host-side FFT length
+
+        # Monotonic receive-timestamp base (see process_data_point)
+        self._t0_ns = time.monotonic_ns()
+        self._epoch0_ms = time.time() * 1000.0
+
+        # Revision counters so update_loop can skip redraws when nothing
+        # new has arrived between GUI ticks
+        self._data_rev = 0
+        self._fft_rev = 0
+        self._last_render_p1 = None
+        self._last_render_p2 = None
+        self._last_fft_rev = -1
+        self._x_cache = None
+        # Coarse dirty flag: when the stream stalls and no setting
+        # changed, update_loop returns before touching any widget
+        self._dirty = False
         
         # Spectrogram / History
         self.spectrogram_history_len = 150
@@ -822,17 +1094,48 @@ class AdaptiveGripperGUI(QMainWindow):
         self.current_segment_start = None
 
         # Thresholds
-        self.thresholds = [] 
-        self.threshold_lines = {} 
+        self.thresholds = []
+        self.threshold_lines = {}
+        # id -> ((color, style), QPen): one pen per threshold shared by
+        # both plots, rebuilt only when its color/style change
+        self._thresh_pen_cache = {}
+        # Monotonic ID source; str(time.time()) could collide on
+        # back-to-back adds
+        self._next_threshold_id = itertools.count(1)
+        # Coalesces bursts of threshold-line rebuilds (e.g. a stream
+        # group toggle unchecking several sub-boxes) into one pass
+        self._threshold_lines_timer = QTimer(self)
+        self._threshold_lines_timer.setSingleShot(True)
+        self._threshold_lines_timer.setInterval(0)
+        self._threshold_lines_timer.timeout.connect(self.update_threshold_lines)
+        # Recording files are block-buffered; this bounds the data-loss
+        # window on a crash to ~half a second
+        self._rec_flush_timer = QTimer(self)
+        self._rec_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._rec_flush_timer.setInterval(500)
+        self._rec_flush_timer.timeout.connect(self._flush_recording)
+        # Parallel arrays mirroring self.thresholds so the per-tick
+        # compare is one vectorized operation
+        self._thresh_values = np.empty(0, dtype=np.float32)
+        self._thresh_keys = []
         self.lamp_panel = LampPanel()
         
         # Recording & Replay
         self.is_recording = False
-        self.recording_data = [] 
-        self.recording_fft = [] 
-        self.replay_data = []    
-        self.replay_fft_data = [] 
+        self.recording_fft = []
+        self.signals_csv_handle = None
+        self.signals_csv_writer = None
+        self._pending_event_label = ""
+        self.replay_data = []
+        self.replay_fft_data = []
         self.replay_index = 0
+        self._last_replay_tick = 0.0
+        # SoA mirror of replay_data built once at load time
+        self.replay_len = 0
+        self.replay_t = np.empty(0, dtype=np.float64)
+        self.replay_arrays = {}
+        self._last_replay_fft_idx = None
+        self._replay_fft_t = np.empty(0, dtype=np.float64)
         
         self.serial_thread = None
         self.is_connected = False
@@ -854,22 +1157,46 @@ class AdaptiveGripperGUI(QMainWindow):
             'srv': {'color': COLOR_ACCENT_5, 'style': Qt.PenStyle.SolidLine, 'width': 2},
             'grp': {'color': COLOR_ACCENT_5, 'style': Qt.PenStyle.DashLine, 'width': 1},
         }
-        
+        # One QPen per channel, shared by the live and replay curves and
+        # rebuilt only when the style editor changes a channel
+        self._pens = {}
+        # The channel set is fixed for the life of the app, so the sorted
+        # list the threshold dialogs show can be built once
+        self._sorted_signals = sorted(self.curve_styles)
+
         # Theme Init
         self.current_theme = "Dark"
 
+        # Cached visible-curve lists, rebuilt only on visibility toggles
+        self._visible_p1 = []
+        self._visible_p2 = []
+        self._visible_keys = set()
+        self._visible_replay_p1 = []
+        self._visible_replay_p2 = []
+
         # Setup UI
         self.setup_ui()
         self.setup_plotting()
+        self._rebuild_visible_curves()
         self.apply_theme("Dark")
+
+        # Settings edits must force a redraw even while the stream is idle
+        for s in (self.settings_p1, self.settings_p2):
+            s.spin_window.valueChanged.connect(self._mark_dirty)
+            s.chk_center.toggled.connect(self._mark_dirty)
+            s.spin_dc_range.valueChanged.connect(self._mark_dirty)
         
         # Timer for updates
         self.timer = QTimer()
+        # Coarse timers let the OS coalesce wakeups; 30 Hz plotting
+        # does not need millisecond precision
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.timer.timeout.connect(self.update_loop)
         self.timer.start(33)
 
         # Timer for replay
         self.replay_timer = QTimer()
+        self.replay_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.replay_timer.timeout.connect(self.update_replay_loop)
 
     def apply_theme(self, theme_name):
@@ -915,30 +1242,34 @@ class AdaptiveGripperGUI(QMainWindow):
         
         file_menu = menubar.addMenu('&File')
         load_action = QAction('Load Replay', self)
-        load_action.triggered.connect(self.load_replay_file)
+        load_action.triggered.connect(self.load_replay_file,
+                                      Qt.ConnectionType.UniqueConnection)
         file_menu.addAction(load_action)
         
         import_action = QAction('Import Data', self)
-        import_action.triggered.connect(self.import_data)
+        import_action.triggered.connect(self.import_data,
+                                        Qt.ConnectionType.UniqueConnection)
         file_menu.addAction(import_action)
         
         file_menu.addSeparator()
         exit_action = QAction('Exit', self)
-        exit_action.triggered.connect(self.close)
+        exit_action.triggered.connect(self.close,
+                                      Qt.ConnectionType.UniqueConnection)
         file_menu.addAction(exit_action)
         
         view_menu = menubar.addMenu('&View')
         theme_menu = view_menu.addMenu('Theme')
         dark_action = QAction('Dark', self)
-        dark_action.triggered.connect(lambda: self.apply_theme("Dark"))
+        dark_action.triggered.connect(partial(self.apply_theme, "Dark"))
         theme_menu.addAction(dark_action)
         light_action = QAction('Light', self)
-        light_action.triggered.connect(lambda: self.apply_theme("Light"))
+        light_action.triggered.connect(partial(self.apply_theme, "Light"))
         theme_menu.addAction(light_action)
         
         view_menu.addSeparator()
         self.action_show_fft = QAction('Show FFT', self, checkable=True)
-        self.action_show_fft.toggled.connect(self.toggle_fft_view_menu)
+        self.action_show_fft.toggled.connect(self.toggle_fft_view_menu,
+                                             Qt.ConnectionType.UniqueConnection)
         view_menu.addAction(self.action_show_fft)
         
         toolbar = QToolBar("Connection")
@@ -1167,6 +1498,8 @@ class AdaptiveGripperGUI(QMainWindow):
         layout_raw = QVBoxLayout(self.tab_raw)
         self.text_raw = QTextEdit()
         self.text_raw.setReadOnly(True)
+        # Bound the document so scrollback layout cost stays constant
+        self.text_raw.document().setMaximumBlockCount(2000)
         self.text_raw.setStyleSheet(f"background-color: #000; color: #0f0; font-family: Consolas, monospace;")
         layout_raw.addWidget(self.text_raw)
         
@@ -1178,12 +1511,10 @@ class AdaptiveGripperGUI(QMainWindow):
         self.update_layout_visibility()
 
     def add_threshold(self):
-        # Use dynamic keys if possible, otherwise fallback
-        signals = sorted(list(self.curve_styles.keys()))
-        dlg = ThresholdEditorDialog(signals, parent=self)
+        dlg = ThresholdEditorDialog(self._sorted_signals, parent=self)
         if dlg.exec():
             data = dlg.result_data
-            data['id'] = str(time.time())
+            data['id'] = str(next(self._next_threshold_id))
             self.thresholds.append(data)
             self.update_threshold_list()
             self.update_threshold_lines()
@@ -1194,8 +1525,7 @@ class AdaptiveGripperGUI(QMainWindow):
         if row < 0: return
         
         old_data = self.thresholds[row]
-        signals = sorted(list(self.curve_styles.keys()))
-        dlg = ThresholdEditorDialog(signals, current_data=old_data, parent=self)
+        dlg = ThresholdEditorDialog(self._sorted_signals, current_data=old_data, parent=self)
         if dlg.exec():
             data = dlg.result_data
             data['id'] = old_data['id']
@@ -1213,10 +1543,25 @@ class AdaptiveGripperGUI(QMainWindow):
         self.update_threshold_lines()
         self.lamp_panel.update_lamps(self.thresholds, [])
 
+    def _rebuild_threshold_arrays(self):
+        self._thresh_values = np.fromiter((t['value'] for t in self.thresholds),
+                                          dtype=np.float32, count=len(self.thresholds))
+        self._thresh_keys = [t['signal'] for t in self.thresholds]
+
     def update_threshold_list(self):
-        self.list_thresholds.clear()
-        for t in self.thresholds:
-            self.list_thresholds.addItem(f"{t['name']} ({t['signal']} > {t['value']})")
+        self._rebuild_threshold_arrays()
+        # Reuse existing rows instead of clear()+re-add so edits keep the
+        # current selection and avoid a full model reset
+        lst = self.list_thresholds
+        for i, t in enumerate(self.thresholds):
+            text = f"{t['name']} ({t['signal']} > {t['value']})"
+            if i < lst.count():
+                if lst.item(i).text() != text:
+                    lst.item(i).setText(text)
+            else:
+                lst.addItem(text)
+        while lst.count() > len(self.thresholds):
+            lst.takeItem(lst.count() - 1)
 
     def toggle_lamp_panel(self):
         if self.lamp_panel.isVisible():
@@ -1224,89 +1569,101 @@ class AdaptiveGripperGUI(QMainWindow):
         else:
             self.lamp_panel.show()
 
+    def _get_threshold_pen(self, t):
+        style_key = (t['color'], t['style'])
+        cached = self._thresh_pen_cache.get(t['id'])
+        if cached is None or cached[0] != style_key:
+            cached = (style_key, _make_pen(t['color'], 2, t['style']))
+            self._thresh_pen_cache[t['id']] = cached
+        return cached[1]
+
     def update_threshold_lines(self):
-        # Clear all existing threshold lines from both plots
-        for line_set in self.threshold_lines.values():
-            for line in line_set:
-                try:
-                    self.plot_time_1.removeItem(line)
-                except: 
-                    pass
-                try:
-                    self.plot_time_2.removeItem(line)
-                except: 
-                    pass
-        self.threshold_lines.clear()
-        
-        # Don't create lines if in FFT mode
-        if self.action_show_fft.isChecked():
-            return
-        
-        # Recreate threshold lines based on current signal visibility
-        for t in self.thresholds:
-            sig = t['signal']
-            
-            # Check if this signal curve exists and is visible on each plot
-            visible_p1 = (sig in self.curves_p1 and 
-                         self.curves_p1[sig].isVisible() and 
-                         self.plot_time_1.isVisible())
-            
-            visible_p2 = (sig in self.curves_p2 and 
-                         self.curves_p2[sig].isVisible() and 
-                         self.plot_time_2.isVisible())
-            
-            lines_created = []
-            
-            # Create line for Plot 1 if signal is visible there
-            if visible_p1:
-                pen1 = pg.mkPen(color=t['color'], width=2, style=t['style'])
-                opts1 = {'position': 0.1, 'color': t['color'], 'movable': False}
-                line_p1 = pg.InfiniteLine(angle=0, pos=t['value'], pen=pen1, label=t['name'], labelOpts=opts1)
-                line_p1.setZValue(100)  # Ensure threshold lines are on top
-                self.plot_time_1.addItem(line_p1)
-                lines_created.append(line_p1)
-                
-            # Create line for Plot 2 if signal is visible there
-            if visible_p2:
-                pen2 = pg.mkPen(color=t['color'], width=2, style=t['style'])
-                opts2 = {'position': 0.1, 'color': t['color'], 'movable': False}
-                line_p2 = pg.InfiniteLine(angle=0, pos=t['value'], pen=pen2, label=t['name'], labelOpts=opts2)
-                line_p2.setZValue(100)  # Ensure threshold lines are on top
-                self.plot_time_2.addItem(line_p2)
-                lines_created.append(line_p2)
-            
-            # Store references to created lines
-            if lines_created:
-                self.threshold_lines[t['id']] = lines_created
+        # Drop pens for thresholds that no longer exist
+        live_ids = {t['id'] for t in self.thresholds}
+        for tid in list(self._thresh_pen_cache):
+            if tid not in live_ids:
+                del self._thresh_pen_cache[tid]
+
+        # Decide which (threshold, plot) cells need a line right now
+        desired = {}
+        if not self.action_show_fft.isChecked():
+            # Hoisted out of the loop: two Qt calls total instead of two
+            # per threshold, and the cached visible-curve sets replace
+            # the per-curve isVisible() round-trips
+            p1_vis = self.plot_time_1.isVisible()
+            p2_vis = self.plot_time_2.isVisible()
+            p1_keys = {k for k, _ in self._visible_p1} if p1_vis else ()
+            p2_keys = {k for k, _ in self._visible_p2} if p2_vis else ()
+            for t in self.thresholds:
+                sig = t['signal']
+                visible_p1 = sig in p1_keys
+                visible_p2 = sig in p2_keys
+                if visible_p1 or visible_p2:
+                    desired[t['id']] = (t, visible_p1, visible_p2)
+
+        # Remove lines whose threshold is gone or fully hidden
+        for tid in list(self.threshold_lines):
+            if tid not in desired:
+                for plot, slot in self.threshold_lines.pop(tid).items():
+                    if slot is not None:
+                        (self.plot_time_1 if plot == 'p1' else self.plot_time_2).removeItem(slot[0])
+
+        # Add the missing lines; reposition unchanged ones in place.
+        # Creating/removing an InfiniteLine is a QGraphicsScene operation,
+        # so a mere value edit must not rebuild the whole set. Lines are
+        # recreated only when their label text or color changes, since
+        # those are baked in at construction.
+        for tid, (t, visible_p1, visible_p2) in desired.items():
+            pen = self._get_threshold_pen(t)
+            style_key = (t['color'], t['style'], t['name'])
+            slots = self.threshold_lines.setdefault(tid, {'p1': None, 'p2': None})
+            for plot_key, visible, plot in (('p1', visible_p1, self.plot_time_1),
+                                            ('p2', visible_p2, self.plot_time_2)):
+                slot = slots[plot_key]
+                if slot is not None and (not visible or slot[1] != style_key):
+                    plot.removeItem(slot[0])
+                    slot = slots[plot_key] = None
+                if not visible:
+                    continue
+                if slot is None:
+                    opts = {'position': 0.1, 'color': t['color'], 'movable': False}
+                    line = pg.InfiniteLine(angle=0, pos=t['value'], pen=pen,
+                                           label=t['name'], labelOpts=opts)
+                    line.setZValue(100)  # Ensure threshold lines are on top
+                    plot.addItem(line)
+                    slots[plot_key] = (line, style_key)
+                else:
+                    slot[0].setPos(t['value'])
+                    slot[0].setPen(pen)
 
     def check_thresholds(self):
         """Check threshold conditions and update lamp panel in real-time"""
         if not self.thresholds: 
             return
         
+        if len(self._thresh_values) != len(self.thresholds):
+            self._rebuild_threshold_arrays()
+
+        # One vectorized compare of every threshold against its signal's
+        # newest sample; missing/empty signals compare against NaN and
+        # therefore never fire
+        last_vals = np.fromiter(
+            (self.data[s].last() if s in self.data and self.data[s] else np.nan
+             for s in self._thresh_keys),
+            dtype=np.float32, count=len(self._thresh_keys))
+        fired = last_vals > self._thresh_values
+
         active_ids = set()
         visible_thresholds = []
-        
-        for t in self.thresholds:
-            sig = t['signal']
-            
-            # Check if signal is active/visible on EITHER plot
-            is_enabled = False
-            if sig in self.curves_p1 and self.curves_p1[sig].isVisible(): 
-                is_enabled = True
-            if sig in self.curves_p2 and self.curves_p2[sig].isVisible(): 
-                is_enabled = True
-            
-            # Only process visible thresholds
-            if is_enabled:
+        visible_keys = self._visible_keys
+
+        for i, t in enumerate(self.thresholds):
+            # Only process thresholds whose signal shows on either plot
+            if t['signal'] in visible_keys:
                 visible_thresholds.append(t)
-                
-                # Check if threshold is exceeded
-                if sig in self.data and self.data[sig]:
-                    val = self.data[sig][-1]
-                    if val > t['value']:
-                        active_ids.add(t['id'])
-        
+                if fired[i]:
+                    active_ids.add(t['id'])
+
         # Only show lamps for thresholds with visible signals
         self.lamp_panel.update_lamps(visible_thresholds, active_ids)
 
@@ -1371,11 +1728,11 @@ class AdaptiveGripperGUI(QMainWindow):
         h_controls.addWidget(self.btn_play_replay)
 
         btn_step_back = QPushButton("<<")
-        btn_step_back.clicked.connect(lambda: self.step_replay(-1))
+        btn_step_back.clicked.connect(partial(self.step_replay, -1))
         h_controls.addWidget(btn_step_back)
         
         btn_step_fwd = QPushButton(">>")
-        btn_step_fwd.clicked.connect(lambda: self.step_replay(1))
+        btn_step_fwd.clicked.connect(partial(self.step_replay, 1))
         h_controls.addWidget(btn_step_fwd)
         
         h_controls.addWidget(QLabel("Speed (ms):"))
@@ -1438,9 +1795,12 @@ class AdaptiveGripperGUI(QMainWindow):
         self.replay_curves_p2 = {}
         
         def create_replay_curve(plot_widget, key, name):
-            s = self.curve_styles[key]
-            pen = pg.mkPen(s['color'], width=s['width'], style=s['style'])
-            return plot_widget.plot(pen=pen, name=name)
+            c = plot_widget.plot(pen=self._get_pen(key), name=name)
+            # Same treatment as the live curves: render at most roughly
+            # viewport-width points however wide the scrub window is
+            c.setDownsampling(auto=True, method='peak')
+            c.setClipToView(True)
+            return c
         
         keys = ['mlx', 'mly', 'mlz', 'mag', 'mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz', 'cur', 'slip', 's_ind', 'srv', 'grp']
         names = {
@@ -1458,13 +1818,12 @@ class AdaptiveGripperGUI(QMainWindow):
             self.replay_curves_p1[key].setVisible(False)
             self.replay_curves_p2[key].setVisible(False)
 
-        # Replay FFT Bar Graph with border for better visibility
-        self.curve_replay_fft = pg.BarGraphItem(
-            x=[], height=[], width=1.0, 
-            brush=COLOR_ACCENT_1, 
+        # Replay FFT uses the same stepped-curve rendering as the live FFT
+        self.curve_replay_fft = self.plot_replay_fft.plot(
+            stepMode='center', fillLevel=0,
+            brush=COLOR_ACCENT_1,
             pen=pg.mkPen(COLOR_ACCENT_1, width=1)
         )
-        self.plot_replay_fft.addItem(self.curve_replay_fft)
         
         # For backward compatibility with existing logic that uses self.replay_curves
         self.replay_curves = self.replay_curves_p1
@@ -1568,7 +1927,7 @@ class AdaptiveGripperGUI(QMainWindow):
                         cp1.setChecked(False)
                         cp2.setChecked(False)
                 # Update threshold lines when group is toggled
-                self.update_threshold_lines()
+                self._schedule_threshold_lines()
             
             chk_cmd.toggled.connect(on_main_toggle)
             
@@ -1627,8 +1986,30 @@ class AdaptiveGripperGUI(QMainWindow):
             if hasattr(self, 'replay_curves_p2') and key in self.replay_curves_p2:
                 self.replay_curves_p2[key].setVisible(visible)
                 
-        # Update thresholds visibility immediately
-        self.update_threshold_lines()
+        # Force a redraw on the next tick so a newly shown curve gets data
+        self._last_render_p1 = None
+        self._last_render_p2 = None
+        self._dirty = True
+        self._rebuild_visible_curves()
+
+        # Update thresholds visibility on the next event-loop pass
+        self._schedule_threshold_lines()
+
+    def _schedule_threshold_lines(self):
+        self._threshold_lines_timer.start()
+
+    def _rebuild_visible_curves(self):
+        """Cache the visible curves per plot so the per-tick loops skip the
+        Python<->C++ isVisible() round-trip for every channel."""
+        self._visible_p1 = [(k, c) for k, c in self.curves_p1.items() if c.isVisible()]
+        self._visible_p2 = [(k, c) for k, c in self.curves_p2.items() if c.isVisible()]
+        self._visible_keys = ({k for k, _ in self._visible_p1}
+                              | {k for k, _ in self._visible_p2})
+        if hasattr(self, 'replay_curves_p1'):
+            self._visible_replay_p1 = [(k, c) for k, c in self.replay_curves_p1.items()
+                                       if c.isVisible()]
+            self._visible_replay_p2 = [(k, c) for k, c in self.replay_curves_p2.items()
+                                       if c.isVisible()]
 
     def send_stream_command(self, key, enabled):
         if self.is_connected and self.serial_thread:
@@ -1641,9 +2022,10 @@ class AdaptiveGripperGUI(QMainWindow):
         self.curves_p2 = {}
         
         def create_curve(plot_widget, key, name):
-            s = self.curve_styles[key]
-            pen = pg.mkPen(s['color'], width=s['width'], style=s['style'])
-            c = plot_widget.plot(pen=pen, name=name)
+            c = plot_widget.plot(pen=self._get_pen(key), name=name)
+            # Cap rendered points at roughly viewport width for wide windows
+            c.setDownsampling(auto=True, method='peak')
+            c.setClipToView(True)
             c.setVisible(False)
             return c
 
@@ -1665,21 +2047,28 @@ class AdaptiveGripperGUI(QMainWindow):
             self.curves_p1[key] = create_curve(self.plot_time_1, key, names[key])
             self.curves_p2[key] = create_curve(self.plot_time_2, key, names[key])
 
-        # FFT Bar Graph with border for better visibility
-        self.curve_fft = pg.BarGraphItem(
-            x=[], height=[], width=1.0, 
-            brush=COLOR_ACCENT_1, 
+        # FFT drawn as a stepped, filled curve: visually equivalent bars,
+        # but one QPainterPath instead of one rectangle per bin
+        self.curve_fft = self.plot_fft.plot(
+            stepMode='center', fillLevel=0,
+            brush=COLOR_ACCENT_1,
             pen=pg.mkPen(COLOR_ACCENT_1, width=1)
         )
-        self.plot_fft.addItem(self.curve_fft)
+
+    def _get_pen(self, key):
+        pen = self._pens.get(key)
+        if pen is None:
+            s = self.curve_styles[key]
+            pen = self._pens[key] = _make_pen(s['color'], s['width'], s['style'])
+        return pen
 
     def update_curve_style(self, key):
         if key not in self.curve_styles:
             return
-        
-        s = self.curve_styles[key]
-        pen = pg.mkPen(s['color'], width=s['width'], style=s['style'])
-        
+
+        self._pens.pop(key, None)
+        pen = self._get_pen(key)
+
         if key in self.curves_p1:
             self.curves_p1[key].setPen(pen)
         if key in self.curves_p2:
@@ -1716,7 +2105,7 @@ class AdaptiveGripperGUI(QMainWindow):
             elif not current_threshold and new_thresh:
                 # Added
                 new_thresh['signal'] = key
-                new_thresh['id'] = str(time.time())
+                new_thresh['id'] = str(next(self._next_threshold_id))
                 self.thresholds.append(new_thresh)
             elif current_threshold and new_thresh:
                 # Updated
@@ -1821,26 +2210,48 @@ class AdaptiveGripperGUI(QMainWindow):
         if self.tabs.currentWidget() != self.tab_raw:
             return
 
-        for line in lines[-10:]:
-            self.text_raw.append(line)
-        
+        # One append = one document layout pass instead of one per line.
+        # The worker emits bytes; decode only the lines shown here.
+        self.text_raw.append('\n'.join(
+            l.decode('utf-8', errors='ignore') if isinstance(l, bytes) else l
+            for l in lines[-10:]))
+
         sb = self.text_raw.verticalScrollBar()
         sb.setValue(sb.maximum())
 
     def handle_data_batch(self, batch):
-        for data in batch:
-            self.process_data_point(data)
-
-    def process_data_point(self, data):
+        # One clock read per batch; samples coalesced into the same emit
+        # arrived within ~16 ms of each other anyway
+        recv_ms = self._epoch0_ms + (time.monotonic_ns() - self._t0_ns) / 1e6
+        samples = []
+        for data, raw_line in batch:
+            data = self.process_data_point(data, raw_line, recv_ms)
+            if data is not None:
+                samples.append(data)
+        if samples:
+            self.append_batch(samples)
+
+    def process_data_point(self, data, raw_line=None, recv_ms=None):
+        """Pre-process one packet; returns it if it is a time-series sample,
+        None if it was consumed (FFT frames)."""
         if self.is_recording and hasattr(self, 'recording_file_handle'):
              try:
-                 self.recording_file_handle.write(json.dumps(data) + '\n')
+                 if raw_line is not None:
+                     # The serial worker already has the JSON text; write it
+                     # verbatim instead of re-serializing the parsed dict
+                     self.recording_file_handle.write(raw_line + '\n')
+                 else:
+                     self.recording_file_handle.write(json.dumps(data) + '\n')
              except Exception as e:
                  print(f"Rec write failed: {e}")
-        
-        current_time_ms = time.time() * 1000.0
+
+        # Monotonic stamp anchored to the wall clock at startup, normally
+        # read once per batch by handle_data_batch
+        if recv_ms is None:
+            recv_ms = self._epoch0_ms + (time.monotonic_ns() - self._t0_ns) / 1e6
+        current_time_ms = recv_ms
         data['recv_ts'] = current_time_ms
-        
+
         if 't' not in data or data['t'] == 0:
             data['t'] = current_time_ms
 
@@ -1848,51 +2259,159 @@ class AdaptiveGripperGUI(QMainWindow):
             fft_vals = data.get('data', [])
             if fft_vals:
                 self.process_external_fft(fft_vals)
-            return
+            return None
 
-        self.append_data(data)
+        return data
+
+    def append_batch(self, batch):
+        """Vectorized ingest of a whole serial batch: one (N, 15) array pass
+        instead of per-sample Python loops."""
+        keys = ['mlx', 'mly', 'mlz', 'mag',
+                'mhx', 'mhy', 'mhz',
+                'rmx', 'rmy', 'rmz',
+                'cur', 'slip', 's_ind',
+                'srv', 'grp']
+        n = len(batch)
+        n_keys = len(keys)
+
+        arr = np.fromiter((d.get(k, 0.0) for d in batch for k in keys),
+                          dtype=np.float32, count=n * n_keys).reshape(n, n_keys)
+
+        if self.chk_despike.isChecked():
+            # Prepend the last two raw samples so the rolling 3-tap window
+            # stays continuous across batches
+            prev = np.empty((2, n_keys), dtype=np.float32)
+            for i, k in enumerate(keys):
+                buf = self.spike_buffer[k]
+                if len(buf) >= 2:
+                    prev[0, i] = buf[-2]
+                    prev[1, i] = buf[-1]
+                else:
+                    prev[0, i] = prev[1, i] = arr[0, i]
+            arr_ext = np.vstack((prev, arr))
+            a, b, c = arr_ext[:-2], arr_ext[1:-1], arr_ext[2:]
+            med = np.maximum(np.minimum(a, b), np.minimum(np.maximum(a, b), c))
+        else:
+            med = arr
+
+        # Keep the raw tail so the single-sample path stays consistent
+        for i, k in enumerate(keys):
+            buf = self.spike_buffer[k]
+            buf.extend(arr[max(0, n - 3):, i].tolist())
+            del buf[:-3]
+
+        for i, k in enumerate(keys):
+            self.data[k].extend(med[:, i])
+
+        self.data['timestamp'].extend(
+            np.fromiter((d.get('t', 0) for d in batch), dtype=np.float64, count=n))
+        self.data['recv_ts'].extend(
+            np.fromiter((d.get('recv_ts', 0) for d in batch), dtype=np.float64, count=n))
+        self._data_rev += n
+        self._dirty = True
+
+        if self.is_recording and self.signals_csv_writer is not None:
+            rows = []
+            for j, d in enumerate(batch):
+                lbl = self._pending_event_label
+                self._pending_event_label = ""
+                row = [d.get('t', 0), d.get('recv_ts', 0)]
+                # %.6g matches float32 precision; letting csv stringify
+                # the raw float32 values writes 123.44999694824219-style
+                # noise and triples the cell width
+                row.extend(f"{v:.6g}" for v in med[j])
+                row.append(lbl)
+                rows.append(row)
+            self.signals_csv_writer.writerows(rows)
+
+    def _get_freq_axis(self, sample_rate, num_bins):
+        """Cached per-bin frequency axis; it only changes when the sample
+        rate or bin count change, so rebuilding it per frame is wasted
+        allocation."""
+        key = (sample_rate, num_bins)
+        freqs = self._freq_axis_cache.get(key)
+        if freqs is None:
+            # Arduino sends FFT_SAMPLES/2 bins from an FFT_SAMPLES-point FFT
+            freq_resolution = sample_rate / (num_bins * 2)
+            freqs = np.arange(num_bins, dtype=np.float32) * np.float32(freq_resolution)
+            self._freq_axis_cache[key] = freqs
+        return freqs
+
+    def _get_fft_ticks(self, freqs, freq_res, include_important=True):
+        """Memoized major/minor tick lists for an FFT axis. The axis only
+        changes with the device config, so rebuilding the tick tuples and
+        landmark lookups per rendered frame is wasted work."""
+        key = (id(freqs), len(freqs), float(freq_res), include_important)
+        ticks = self._fft_tick_cache.get(key)
+        if ticks is not None:
+            return ticks
+
+        num_bins = len(freqs)
+        if num_bins > 20:
+            step = max(1, num_bins // 20)
+            tick_indices = set(range(0, num_bins, step))
+        else:
+            tick_indices = set(range(num_bins))
+
+        if include_important and freq_res > 0:
+            # Landmark frequencies (30 Hz cutoff region matters most);
+            # the axis is uniform so nearest bin is a rounded division
+            for f in (0, 10, 20, 30, 40, 50, 100, 150, 200):
+                tick_indices.add(min(num_bins - 1, int(round(f / freq_res))))
+
+        ordered = sorted(tick_indices)
+        major = [(float(freqs[i]), f"{freqs[i]:.1f}") for i in ordered]
+        minor = [(float(freqs[i]), "") for i in range(num_bins)
+                 if i not in tick_indices]
+        ticks = [major, minor]
+        self._fft_tick_cache[key] = ticks
+        return ticks
 
     def process_external_fft(self, fft_vals):
         """Process FFT data received from device"""
         num_bins = len(fft_vals)
-        if num_bins < 2: 
+        if num_bins < 2:
             return
-        
+
         # Get sample rate from config
         sample_rate = self.spin_fft_rate.value()
-        
-        # Calculate frequency bins dynamically
-        # Arduino sends FFT_SAMPLES/2 bins from a full FFT_SAMPLES-point FFT
-        # So if we receive num_bins, the original FFT size is num_bins * 2
-        # Frequency resolution = sample_rate / fft_size
+
         fft_size = num_bins * 2
         freq_resolution = sample_rate / fft_size
-        
-        # Calculate center frequency for each bin
-        freqs = np.arange(num_bins) * freq_resolution
-        
-        # Convert to numpy array for consistency
-        mags = np.array(fft_vals)
-        
-        # Debug: Print first few bins to verify frequency mapping
-        print(f"\n=== FFT Debug Info ===")
-        print(f"Sample Rate: {sample_rate} Hz")
-        print(f"Num Bins: {num_bins}")
-        print(f"FFT Size: {fft_size}")
-        print(f"Freq Resolution: {freq_resolution:.3f} Hz")
-        print(f"Max Frequency: {freqs[-1]:.1f} Hz (should be ~{sample_rate/2:.1f} Hz)")
-        print(f"\nFirst 10 bins:")
-        for i in range(min(10, num_bins)):
-            print(f"  Bin {i}: {freqs[i]:.2f} Hz -> Mag {mags[i]:.3f}")
-        if num_bins > 10:
-            print(f"  ...")
-            print(f"  Bin {num_bins-1}: {freqs[-1]:.2f} Hz -> Mag {mags[-1]:.3f}")
-        
+
+        # Cached frequency axis; converted magnitudes reused everywhere below
+        freqs = self._get_freq_axis(sample_rate, num_bins)
+        # Reuse one magnitude buffer: fft_vals is a fresh Python list per
+        # JSON frame, so np.asarray would allocate at the device FFT rate
+        mags = self._mags_buf
+        if mags is None or len(mags) != num_bins:
+            mags = self._mags_buf = np.empty(num_bins, dtype=np.float32)
+        mags[:] = fft_vals
+        
+        # Debug: print the frequency mapping once per config change, not
+        # per packet -- console I/O at the device FFT rate is expensive
+        if (sample_rate, num_bins) != self._last_fft_cfg:
+            self._last_fft_cfg = (sample_rate, num_bins)
+            print(f"\n=== FFT Debug Info ===")
+            print(f"Sample Rate: {sample_rate} Hz")
+            print(f"Num Bins: {num_bins}")
+            print(f"FFT Size: {fft_size}")
+            print(f"Freq Resolution: {freq_resolution:.3f} Hz")
+            print(f"Max Frequency: {freqs[-1]:.1f} Hz (should be ~{sample_rate/2:.1f} Hz)")
+            print(f"\nFirst 10 bins:")
+            for i in range(min(10, num_bins)):
+                print(f"  Bin {i}: {freqs[i]:.2f} Hz -> Mag {mags[i]:.3f}")
+            if num_bins > 10:
+                print(f"  ...")
+                print(f"  Bin {num_bins-1}: {freqs[-1]:.2f} Hz -> Mag {mags[-1]:.3f}")
+
         # Store FFT data
         self.fft_data['freqs'] = freqs
         self.fft_data['mags'] = mags
         self.fft_data['freq_resolution'] = freq_resolution
         self.fft_data['fft_size'] = fft_size
+        self._fft_rev += 1
+        self._dirty = True
         
         # Find dominant frequency (skip DC component at index 0)
         try:
@@ -1987,41 +2506,55 @@ class AdaptiveGripperGUI(QMainWindow):
                 'cur', 'slip', 's_ind', 
                 'srv', 'grp']
                 
-        filtered_data = {}
-        
+        despike_on = self.chk_despike.isChecked()
+        recording = self.is_recording and self.signals_csv_writer is not None
+        row = [ts, data.get('recv_ts', 0)] if recording else None
+
         for key in keys:
             raw_val = data.get(key, 0.0)
-            
-            if key in self.spike_buffer:
-                self.spike_buffer[key].append(raw_val)
-                if len(self.spike_buffer[key]) > 3:
-                    self.spike_buffer[key].pop(0)
-            
+
+            buf = self.spike_buffer.get(key)
+            if buf is not None:
+                if not buf:
+                    # Seed with the first sample duplicated so the 3-tap
+                    # window is valid from the very first packet
+                    buf.extend((raw_val, raw_val))
+                buf.append(raw_val)
+                if len(buf) > 3:
+                    buf.pop(0)
+
             val_to_store = raw_val
-            
-            if self.chk_despike.isChecked() and key in self.spike_buffer:
-                buf = self.spike_buffer[key]
-                if len(buf) == 3:
-                    val_to_store = sorted(buf)[1]
-            
-            filtered_data[key] = val_to_store
 
-        for key in keys:
-            self.data[key].append(filtered_data[key])
-            
+            if despike_on and buf is not None:
+                # Branchless median-of-3: no sort, no list allocation
+                a, b, c = buf
+                val_to_store = max(min(a, b), min(max(a, b), c))
+
+            self.data[key].append(val_to_store)
+            if recording:
+                row.append(val_to_store)
+
         self.data['timestamp'].append(ts)
         self.data['recv_ts'].append(data.get('recv_ts', 0))
-        
-        if len(self.data['timestamp']) > self.buffer_size + 1000:
-            cutoff = len(self.data['timestamp']) - self.buffer_size
-            for k in self.data:
-                self.data[k] = self.data[k][cutoff:]
+        self._data_rev += 1
+        self._dirty = True
 
-        if self.is_recording:
-            record_packet = data.copy()
-            for k, v in filtered_data.items():
-                record_packet[k] = v
-            self.recording_data.append(record_packet)
+        if recording:
+            row.append(self._pending_event_label)
+            self._pending_event_label = ""
+            self.signals_csv_writer.writerow(row)
+
+    def _flush_recording(self):
+        import os
+        try:
+            if getattr(self, 'recording_file_handle', None):
+                self.recording_file_handle.flush()
+                os.fsync(self.recording_file_handle.fileno())
+            if self.signals_csv_handle:
+                self.signals_csv_handle.flush()
+                os.fsync(self.signals_csv_handle.fileno())
+        except Exception as e:
+            print(f"Rec flush failed: {e}")
 
     def toggle_recording(self):
         if not self.is_recording:
@@ -2040,53 +2573,125 @@ class AdaptiveGripperGUI(QMainWindow):
             self.recording_file_path = os.path.join(save_dir, "raw_data.txt")
             
             try:
-                self.recording_file_handle = open(self.recording_file_path, 'w', buffering=1) 
-                
+                # Block-buffered: line buffering would flush (one syscall)
+                # per sample at the full serial rate
+                self.recording_file_handle = open(self.recording_file_path, 'w', buffering=65536)
+
+                # Stream filtered samples straight to CSV instead of
+                # accumulating them in memory for the whole session
+                self.signals_csv_path = os.path.join(save_dir, "signals.csv")
+                self.signals_csv_handle = open(self.signals_csv_path, 'w', newline='')
+                self.signals_csv_writer = csv.writer(self.signals_csv_handle)
+                self.signals_csv_writer.writerow(
+                    ['timestamp', 'recv_ts', 'mlx', 'mly', 'mlz', 'mag',
+                     'mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz',
+                     'cur', 'slip', 's_ind', 'srv', 'grp', 'label'])
+                self._pending_event_label = ""
+
                 self.is_recording = True
-                self.recording_data = [] 
-                self.recording_fft = []  
-                
+                self.recording_fft = []
+                self._rec_flush_timer.start()
+
                 self.btn_record.setText("Stop Recording")
                 self.text_raw.append(f">> RECORDING STARTED: {folder_name}/raw_data.txt")
-                
+
             except Exception as e:
                 self.text_raw.append(f"!! RECORDING INIT FAILED: {e}")
                 if hasattr(self, 'recording_file_handle'): self.recording_file_handle.close()
+                if self.signals_csv_handle:
+                    self.signals_csv_handle.close()
+                    self.signals_csv_handle = None
+                    self.signals_csv_writer = None
                 self.btn_record.setChecked(False)
 
         else:
             self.is_recording = False
+            self._rec_flush_timer.stop()
             self.btn_record.setText("Record")
-            
+
             if hasattr(self, 'recording_file_handle'):
                 self.recording_file_handle.close()
                 self.recording_file_handle = None
-                
+
+            if self.signals_csv_handle:
+                self.signals_csv_handle.close()
+                self.signals_csv_handle = None
+                self.signals_csv_writer = None
+
             self.text_raw.append(f">> RECORDING STOPPED.")
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if hasattr(self, 'timer') and not self.timer.isActive():
+            self.timer.start(33)
+
+    def hideEvent(self, event):
+        # No point dispatching plot updates while the window is hidden
+        super().hideEvent(event)
+        if hasattr(self, 'timer'):
+            self.timer.stop()
+
+    def _mark_dirty(self, *_args):
+        self._dirty = True
+        # Also drop the per-panel render state: the skip check keys on
+        # (data_rev, window), so a centering/DC edit alone would
+        # otherwise be ignored until the next sample arrives
+        self._last_render_p1 = None
+        self._last_render_p2 = None
+
     def update_loop(self):
+        if self.isMinimized():
+            return
+        if not self._dirty:
+            return
+        self._dirty = False
         if len(self.data['timestamp']) > 1:
-            
-            def update_plot_curves(curves, settings):
-                visible_vals = []
+
+            def update_plot_curves(curve_list, settings, state_attr):
                 window_size = settings.spin_window.value()
-                
-                for key, curve in curves.items():
-                    if key in self.data and curve.isVisible():
-                        y_data = self.data[key][-window_size:]
-                        curve.setData(y_data)
-                        if settings.chk_center.isChecked():
-                            visible_vals.extend(y_data)
-                settings.apply_dc_center(visible_vals)
+
+                # Skip the redraw when no new samples arrived and the
+                # window setting is unchanged since the last render
+                state = (self._data_rev, window_size)
+                if getattr(self, state_attr) == state:
+                    return
+                setattr(self, state_attr, state)
+
+                center_on = settings.chk_center.isChecked()
+                # Running sums instead of concatenating all visible
+                # windows just to take one mean
+                total = 0.0
+                n_vals = 0
+
+                # All channel buffers grow in lockstep, so the window
+                # bounds are computed once for the whole panel
+                count = min(len(self.data['timestamp']), window_size)
+
+                # Share one x array across every curve; pyqtgraph would
+                # otherwise arange a fresh one per curve per frame
+                x = self._x_cache
+                if x is None or len(x) != count:
+                    x = np.arange(count, dtype=np.float32)
+                    self._x_cache = x
+
+                for key, curve in curve_list:
+                    y_data = self.data[key].tail(count)
+                    curve.setData(x=x, y=y_data, skipFiniteCheck=True)
+                    if center_on:
+                        total += float(y_data.sum(dtype=np.float64))
+                        n_vals += y_data.size
+                if center_on and n_vals:
+                    settings.center_on_value(total / n_vals)
 
             if self.plot_time_1.isVisible():
-                update_plot_curves(self.curves_p1, self.settings_p1)
-                
+                update_plot_curves(self._visible_p1, self.settings_p1, '_last_render_p1')
+
             if self.plot_time_2.isVisible():
-                update_plot_curves(self.curves_p2, self.settings_p2)
-                    
-        # Update FFT plot if data is available and plot is visible
-        if self.plot_fft.isVisible():
+                update_plot_curves(self._visible_p2, self.settings_p2, '_last_render_p2')
+
+        # Update FFT plot if new data is available and plot is visible
+        if self.plot_fft.isVisible() and self._fft_rev != self._last_fft_rev:
+            self._last_fft_rev = self._fft_rev
             if len(self.fft_data['freqs']) > 0 and len(self.fft_data['mags']) > 0:
                 # Ensure arrays are same length to prevent jitter
                 if len(self.fft_data['freqs']) == len(self.fft_data['mags']):
@@ -2094,45 +2699,18 @@ class AdaptiveGripperGUI(QMainWindow):
                     mags = self.fft_data['mags']
                     freq_res = self.fft_data.get('freq_resolution', 1.0)
                     
-                    # Update bar graph - each bin is a bar
-                    # Width of each bar is the frequency resolution (80% to leave gaps)
-                    self.curve_fft.setOpts(x=freqs, height=mags, width=freq_res * 0.8)
+                    # stepMode='center' wants bin edges: one more point
+                    # than there are magnitudes
+                    edges = np.append(freqs - 0.5 * freq_res,
+                                      freqs[-1] + 0.5 * freq_res)
+                    self.curve_fft.setData(edges, mags)
                     
                     # Set x-axis range to show all bins
                     self.plot_fft.setXRange(freqs[0] - freq_res, freqs[-1] + freq_res, padding=0.02)
                     
-                    # Update x-axis ticks to show frequency values
-                    # Prioritize showing low frequencies clearly (0-50Hz region important for 30Hz cutoff)
-                    num_bins = len(freqs)
-                    
-                    # Always show important frequencies: 0, 10, 20, 30, 40, 50Hz and then subsample
-                    important_freqs = [0, 10, 20, 30, 40, 50, 100, 150, 200]
-                    tick_indices = []
-                    
-                    for imp_f in important_freqs:
-                        # Find closest bin to this frequency
-                        idx = np.argmin(np.abs(freqs - imp_f))
-                        if idx < num_bins and idx not in tick_indices:
-                            tick_indices.append(idx)
-                    
-                    # Add additional ticks for higher frequencies
-                    if num_bins > 20:
-                        step = max(1, num_bins // 20)
-                        for i in range(0, num_bins, step):
-                            if i not in tick_indices:
-                                tick_indices.append(i)
-                    else:
-                        # Show all bins
-                        tick_indices = list(range(num_bins))
-                    
-                    tick_indices = sorted(set(tick_indices))
-                    
-                    # Major ticks with frequency labels
-                    major_ticks = [(freqs[i], f"{freqs[i]:.1f}") for i in tick_indices]
-                    # Minor ticks for all bins (without labels for cleaner look)
-                    minor_ticks = [(freqs[i], "") for i in range(num_bins) if i not in tick_indices]
-                    
-                    self.plot_fft.getAxis('bottom').setTicks([major_ticks, minor_ticks])
+                    # Cached tick lists; only rebuilt when the axis changes
+                    self.plot_fft.getAxis('bottom').setTicks(
+                        self._get_fft_ticks(freqs, freq_res))
             
         self.check_thresholds()
 
@@ -2140,12 +2718,15 @@ class AdaptiveGripperGUI(QMainWindow):
         if not self.data['timestamp']:
             return
         
-        t = self.data['timestamp'][-1]
+        t = self.data['timestamp'].last()
         self.recorded_events.append({
             'timestamp': t,
             'label': label,
             'data_index': len(self.data['timestamp'])
         })
+        if self.is_recording:
+            # Attach the label to the next streamed CSV row
+            self._pending_event_label = label
         print(f"Event Marked: {label} at T={t}")
 
     def export_data(self):
@@ -2164,63 +2745,82 @@ class AdaptiveGripperGUI(QMainWindow):
             
             signals_path = os.path.join(save_dir, "signals.csv")
             
-            with open(signals_path, 'w', newline='') as f:
+            # 1 MiB buffer coalesces the row writes into few syscalls
+            with open(signals_path, 'w', newline='', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 keys = ['timestamp', 'recv_ts', 'mlx', 'mly', 'mlz', 'mag', 'mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz', 'cur', 'slip', 's_ind', 'srv', 'grp']
                 writer.writerow(keys + ['label'])
                 
-                source_data = []
-                
-                if self.recording_data:
-                    for row_data in self.recording_data:
-                        row = []
-                        t = row_data.get('t', 0)
-                        row.append(t)
-                        row.append(row_data.get('recv_ts', 0))
-                        for k in keys[2:]: 
-                            row.append(row_data.get(k, 0))
-                        
-                        lbl = ""
-                        for ev in self.recorded_events:
-                            if abs(ev['timestamp'] - t) < 1.0: 
-                                lbl = ev['label']
-                                break
-                        row.append(lbl)
-                        source_data.append(row)
-                else:
-                    events_map = {e['timestamp']: e['label'] for e in self.recorded_events}
-                    
-                    for i in range(len(self.data['timestamp'])):
-                        t = self.data['timestamp'][i]
-                        recv_t = self.data['recv_ts'][i] if i < len(self.data.get('recv_ts', [])) else 0
-                        row = [t, recv_t] 
+                # Recordings are streamed to signals.csv while they run, so
+                # export always works from the live in-memory buffers.
+                # Snapshot the rings once as plain Python floats
+                snapshot = {k: self.data[k].asarray().tolist() for k in keys}
+                n_rows = len(snapshot['timestamp'])
+
+                # Sorted-join of events onto rows (1 ms tolerance, same
+                # as mark_event granularity): one searchsorted over all
+                # rows instead of scanning the event list per row
+                row_labels = [""] * n_rows
+                if self.recorded_events and n_rows:
+                    ev_ts = np.fromiter((e['timestamp'] for e in self.recorded_events),
+                                        dtype=np.float64, count=len(self.recorded_events))
+                    order = np.argsort(ev_ts, kind='stable')
+                    ev_ts = ev_ts[order]
+                    ev_lbl = [self.recorded_events[j]['label'] for j in order]
+
+                    ts_arr = np.asarray(snapshot['timestamp'], dtype=np.float64)
+                    idx = np.searchsorted(ev_ts, ts_arr)
+                    lo = np.clip(idx - 1, 0, ev_ts.size - 1)
+                    hi = np.clip(idx, 0, ev_ts.size - 1)
+                    d_lo = np.abs(ev_ts[lo] - ts_arr)
+                    d_hi = np.abs(ev_ts[hi] - ts_arr)
+                    best = np.where(d_lo <= d_hi, lo, hi)
+                    dist = np.minimum(d_lo, d_hi)
+                    for i in np.flatnonzero(dist < 1.0):
+                        row_labels[i] = ev_lbl[best[i]]
+
+                # Stream rows into the writer rather than materializing
+                # the whole table a second time next to the snapshot
+                def rowgen():
+                    n_recv = len(snapshot['recv_ts'])
+                    for i in range(n_rows):
+                        row = [snapshot['timestamp'][i],
+                               snapshot['recv_ts'][i] if i < n_recv else 0]
                         for k in keys[2:]:
-                            row.append(self.data[k][i])
-                        
-                        lbl = events_map.get(t, "")
-                        row.append(lbl)
-                        source_data.append(row)
-                        
-                writer.writerows(source_data)
+                            # Signal rings are float32: format at their
+                            # real precision instead of emitting the
+                            # widened float64 repr
+                            row.append(f"{snapshot[k][i]:.6g}")
+                        row.append(row_labels[i])
+                        yield row
+
+                writer.writerows(rowgen())
             
             print(f"Exported signals to {signals_path}")
 
             if self.recording_fft:
                 fft_path = os.path.join(save_dir, "FFT.csv")
                     
-                with open(fft_path, 'w', newline='') as f:
+                with open(fft_path, 'w', newline='', buffering=1 << 20) as f:
                     writer = csv.writer(f)
                     num_bins = len(self.recording_fft[0].get('data', []))
                     header = ['timestamp', 'recv_ts'] + [f'bin_{i}' for i in range(num_bins)]
                     writer.writerow(header)
-                    
-                    for frame in self.recording_fft:
-                        t = frame.get('t', 0)
-                        recv_ts = frame.get('recv_ts', 0)
+
+                    # Stack all frames into one 2D array and let savetxt
+                    # format the wide rows in C instead of per-row writerow
+                    arr = np.zeros((len(self.recording_fft), num_bins + 2), dtype=np.float64)
+                    for i, frame in enumerate(self.recording_fft):
+                        arr[i, 0] = frame.get('t', 0)
+                        arr[i, 1] = frame.get('recv_ts', 0)
                         bins = frame.get('data', [])
-                        row = [t, recv_ts] + bins
-                        writer.writerow(row)
-                        
+                        m = min(len(bins), num_bins)
+                        arr[i, 2:2 + m] = bins[:m]
+                    # Timestamps need fixed-point output: %.6g would
+                    # round epoch-ms values to ~1e6 ms granularity
+                    fmt = ['%.3f', '%.3f'] + ['%.6g'] * num_bins
+                    np.savetxt(f, arr, fmt=fmt, delimiter=',')
+
                 print(f"Exported FFT data to {fft_path}")
             
             self.text_raw.append(f">> SAVED RECORDING: {folder_name}")
@@ -2241,56 +2841,73 @@ class AdaptiveGripperGUI(QMainWindow):
             if path.endswith('.txt'):
                 print("Loading RAW JSON recording...")
                 with open(path, 'r') as f:
-                    lines = f.readlines()
-                    
+                    lines = [l for l in (line.strip() for line in f) if l]
+
+                # One parser invocation over the whole file; a truncated
+                # tail line (killed recording) falls back to per-line
+                try:
+                    parsed = json_loads('[' + ','.join(lines) + ']')
+                except (json.JSONDecodeError, ValueError):
+                    parsed = []
+                    for line in lines:
+                        try:
+                            parsed.append(json_loads(line))
+                        except (json.JSONDecodeError, ValueError):
+                            pass
+
                 t_counter = 0
-                for line in lines:
-                    line = line.strip()
-                    if not line: continue
-                    try:
-                        item = json.loads(line)
-                        
-                        if item.get('type') == 'fft':
-                            item['t'] = float(t_counter)
-                            self.replay_fft_data.append(item)
-                        else:
-                            t_counter += 1
-                            item['t'] = float(t_counter)
-                            
-                            for k in ['mlx', 'mly', 'mlz', 'mag', 'mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz', 'cur', 'slip', 's_ind', 'srv', 'grp']:
-                                if k not in item: item[k] = 0.0
-                                
-                            self.replay_data.append(item)
-                    except json.JSONDecodeError:
-                        pass
-                        
+                for item in parsed:
+                    if item.get('type') == 'fft':
+                        item['t'] = float(t_counter)
+                        self.replay_fft_data.append(item)
+                    else:
+                        t_counter += 1
+                        item['t'] = float(t_counter)
+
+                        for k in ['mlx', 'mly', 'mlz', 'mag', 'mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz', 'cur', 'slip', 's_ind', 'srv', 'grp']:
+                            if k not in item: item[k] = 0.0
+
+                        self.replay_data.append(item)
+
+
                 print(f"Loaded {len(self.replay_data)} samples and {len(self.replay_fft_data)} FFT frames from JSON.")
                 
             else:
-                temp_signals = []
-                with open(path, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        item = {}
-                        for k, v in row.items():
-                            if k == 'label': item[k] = v
-                            else:
-                                try: item[k] = float(v)
-                                except: item[k] = 0.0
-                        
-                        if 'mx' in row: item['mlx'] = row['mx']
-                        if 'my' in row: item['mly'] = row['my']
-                        if 'mz' in row: item['mlz'] = row['mz']
-                        
-                        temp_signals.append(item)
-                
-                t_counter = 0
-                for item in temp_signals:
-                    t_counter += 1
-                    item['t'] = float(t_counter)
+                with open(path, 'r', newline='') as f:
+                    header = next(csv.reader(f), None)
+                if not header:
+                    raise ValueError("Empty CSV file")
+
+                rename = {'mx': 'mlx', 'my': 'mly', 'mz': 'mlz'}
+                names = [rename.get(h.strip(), h.strip()) for h in header]
+                num_cols = [i for i, nm in enumerate(names) if nm != 'label']
+
+                # Numeric columns parse in C; blanks and garbage become 0.0
+                # instead of costing a try/except per cell
+                arr = np.genfromtxt(path, delimiter=',', skip_header=1,
+                                    usecols=num_cols, filling_values=0.0,
+                                    invalid_raise=False)
+                arr = np.nan_to_num(np.atleast_2d(arr), copy=False)
+
+                labels = None
+                if 'label' in names:
+                    lcol = names.index('label')
+                    with open(path, 'r', newline='') as f:
+                        reader = csv.reader(f)
+                        next(reader, None)
+                        labels = [row[lcol] if lcol < len(row) else ''
+                                  for row in reader]
+
+                num_names = [names[i] for i in num_cols]
+                for idx, vals in enumerate(arr):
+                    item = dict(zip(num_names, vals.tolist()))
+                    if labels is not None and idx < len(labels):
+                        item['label'] = labels[idx]
+                    item['t'] = float(idx + 1)
                     self.replay_data.append(item)
                 
             if self.replay_data:
+                self._build_replay_arrays()
                 self.configure_view_from_row(self.replay_data[0])
                 
                 # Auto-detect FFT
@@ -2309,27 +2926,50 @@ class AdaptiveGripperGUI(QMainWindow):
             traceback.print_exc()
 
     def configure_view_from_row(self, row):
-        def check_group(grp_chk, sub_chks, keys):
-            has_data = False
-            for k in keys:
-                if abs(row.get(k, 0)) > 0.000001:
-                    has_data = True
-                    break
-            
-            if has_data:
-                grp_chk.setChecked(True)
-                for k in keys:
-                    if k in sub_chks and abs(row.get(k, 0)) > 0.000001:
-                         sub_chks[k][1].setChecked(True)
-            else:
-                grp_chk.setChecked(False)
-        
-        check_group(self.grp_mag, self.chk_mag, ['mlx', 'mly', 'mlz', 'mag'])
-        check_group(self.grp_mag_hp, self.chk_mag_hp, ['mhx', 'mhy', 'mhz'])
-        check_group(self.grp_raw, self.chk_raw, ['rmx', 'rmy', 'rmz'])
-        check_group(self.grp_cur, self.chk_cur, ['cur'])
-        check_group(self.grp_slip, self.chk_slip, ['slip', 's_ind'])
-        check_group(self.grp_srv, self.chk_srv, ['srv', 'grp'])
+        groups = [
+            (self.grp_mag, self.chk_mag, ['mlx', 'mly', 'mlz', 'mag']),
+            (self.grp_mag_hp, self.chk_mag_hp, ['mhx', 'mhy', 'mhz']),
+            (self.grp_raw, self.chk_raw, ['rmx', 'rmy', 'rmz']),
+            (self.grp_cur, self.chk_cur, ['cur']),
+            (self.grp_slip, self.chk_slip, ['slip', 's_ind']),
+            (self.grp_srv, self.chk_srv, ['srv', 'grp']),
+        ]
+
+        # Block the per-signal checkboxes while flipping them: every
+        # setChecked would otherwise cascade into a curve-visibility update
+        # and threshold redraw. One sync at the end covers all of them.
+        sub_boxes = [w for _, subs, _ in groups
+                     for tup in subs.values() for w in (tup[1], tup[2])]
+        for w in sub_boxes:
+            w.blockSignals(True)
+
+        for grp_chk, sub_chks, keys in groups:
+            # Single pass: test each key once, remember the result for
+            # both the group header and the per-signal boxes
+            present = {k: abs(row.get(k, 0)) > 0.000001 for k in keys}
+            grp_chk.setChecked(any(present.values()))
+            for k, has in present.items():
+                if has and k in sub_chks:
+                    sub_chks[k][1].setChecked(True)
+
+        for w in sub_boxes:
+            w.blockSignals(False)
+
+        for _, sub_chks, _ in groups:
+            for k, (lbl, cp1, cp2, btn) in sub_chks.items():
+                if k in self.curves_p1:
+                    self.curves_p1[k].setVisible(cp1.isChecked())
+                if k in self.replay_curves_p1:
+                    self.replay_curves_p1[k].setVisible(cp1.isChecked())
+                if k in self.curves_p2:
+                    self.curves_p2[k].setVisible(cp2.isChecked())
+                if k in self.replay_curves_p2:
+                    self.replay_curves_p2[k].setVisible(cp2.isChecked())
+
+        self._last_render_p1 = None
+        self._last_render_p2 = None
+        self._rebuild_visible_curves()
+        self.update_threshold_lines()
 
     def toggle_replay(self):
         if self.replay_timer.isActive():
@@ -2338,7 +2978,8 @@ class AdaptiveGripperGUI(QMainWindow):
         else:
             if not self.replay_data:
                 return
-            self.replay_timer.start(33) 
+            self._last_replay_tick = time.monotonic()
+            self.replay_timer.start(33)
             self.btn_play_replay.setText("Pause")
 
     def on_replay_slider_move(self, val):
@@ -2346,93 +2987,163 @@ class AdaptiveGripperGUI(QMainWindow):
         self.update_replay_plot_snapshot()
 
     def update_replay_loop(self):
-        if self.replay_index < len(self.replay_data) - 1:
-            self.replay_index += 1
+        now = time.monotonic()
+        # Advance by however many 33 ms frames actually elapsed, so playback
+        # stays realtime when slow paints make the timer fall behind
+        steps = max(1, int((now - self._last_replay_tick) * 1000 / 33))
+        self._last_replay_tick = now
+
+        last = len(self.replay_data) - 1
+        if self.replay_index < last:
+            self.replay_index = min(self.replay_index + steps, last)
+            # Avoid the on_replay_slider_move re-entry drawing a second frame
+            self.slider_replay.blockSignals(True)
             self.slider_replay.setValue(self.replay_index)
+            self.slider_replay.blockSignals(False)
             self.update_replay_plot_snapshot()
         else:
-            self.toggle_replay() 
+            self.toggle_replay()
+
+    def _build_replay_arrays(self):
+        """Transpose the parsed replay rows (list of dicts) into per-channel
+        NumPy arrays so snapshot rendering slices contiguous views instead of
+        rebuilding a Python list per curve per frame."""
+        n = len(self.replay_data)
+        keys = ['mlx', 'mly', 'mlz', 'mag', 'mhx', 'mhy', 'mhz',
+                'rmx', 'rmy', 'rmz', 'cur', 'slip', 's_ind', 'srv', 'grp']
+        self.replay_len = n
+        self.replay_t = np.fromiter((d.get('t', 0.0) for d in self.replay_data),
+                                    dtype=np.float64, count=n)
+        self.replay_arrays = {
+            k: np.fromiter((d.get(k, 0.0) for d in self.replay_data),
+                           dtype=np.float32, count=n)
+            for k in keys
+        }
+        # FFT frame timestamps are monotonic, so the snapshot path can
+        # binary-search them instead of scanning every frame per tick
+        self._replay_fft_t = np.fromiter((f['t'] for f in self.replay_fft_data),
+                                         dtype=np.float64, count=len(self.replay_fft_data))
+        self._last_replay_fft_idx = None
+
+    def _update_replay_host_fft(self, start_idx, end_idx):
+        """Fallback spectrum for recordings without device FFT frames,
+        computed host-side over the visible window. Prefers a vibration
+        channel (high-pass/raw) since that is what the firmware FFTs."""
+        preferred = ('mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz')
+        visible = [k for k, _ in self._visible_replay_p1]
+        visible += [k for k, _ in self._visible_replay_p2]
+        key = next((k for k in preferred if k in visible),
+                   visible[0] if visible else None)
+
+        n = end_idx - start_idx
+        if key is None or n < 8:
+            self.curve_replay_fft.clear()
+            return
+
+        # The loader rewrites replay timestamps to a per-sample counter,
+        # so the capture rate cannot be derived from them; use the
+        # configured device rate like the device-frame branch does
+        sample_rate = float(self.spin_fft_rate.value())
+        if sample_rate <= 0:
+            self.curve_replay_fft.clear()
+            return
+
+        # Cache only the latest Hann window: during ramp-up from the
+        # start of a recording n grows every tick, so a per-length dict
+        # would accumulate O(window^2) floats
+        hann = self._hann
+        if hann is None or len(hann) != n:
+            hann = self._hann = np.hanning(n).astype(np.float32)
+
+        y = self.replay_arrays[key][start_idx:end_idx]
+        mags = np.abs(np.fft.rfft(y * hann)).astype(np.float32) * (2.0 / n)
+
+        freq_res = sample_rate / n
+        freqs = np.arange(len(mags), dtype=np.float32) * np.float32(freq_res)
+        edges = np.append(freqs - 0.5 * freq_res, freqs[-1] + 0.5 * freq_res)
+        self.curve_replay_fft.setData(edges, mags)
+        self.plot_replay_fft.setXRange(float(edges[0]), float(edges[-1]), padding=0.02)
 
     def update_replay_plot_snapshot(self):
-        if not self.replay_data:
+        if not self.replay_len:
             return
-            
+
         window = self.settings_replay_1.spin_window.value()
         start_idx = max(0, self.replay_index - window)
         end_idx = self.replay_index + 1
-        
-        subset = self.replay_data[start_idx:end_idx]
-        
-        t = [d.get('t', 0) for d in subset]
-        
-        visible_values = []
 
-        def update_replay_curves(curves, settings):
-            for key, curve in curves.items():
-                if curve.isVisible():
-                    y = [d.get(key, 0) for d in subset]
-                    curve.setData(t, y)
-                    if settings.chk_center.isChecked():
-                        visible_values.extend(y)
+        t = self.replay_t[start_idx:end_idx]
+
+        center_total = 0.0
+        center_count = 0
+
+        def update_replay_curves(curve_list, settings):
+            center_on = settings.chk_center.isChecked()
+            for key, curve in curve_list:
+                y = self.replay_arrays[key][start_idx:end_idx]
+                curve.setData(t, y)
+                if center_on:
+                    nonlocal center_total, center_count
+                    center_total += float(y.sum(dtype=np.float64))
+                    center_count += y.size
 
-        update_replay_curves(self.replay_curves_p1, self.settings_replay_1) # Replay Settings used for P1
+        update_replay_curves(self._visible_replay_p1, self.settings_replay_1) # Replay Settings used for P1
         if self.settings_replay_2.isVisible():
-             update_replay_curves(self.replay_curves_p2, self.settings_replay_2)
+             update_replay_curves(self._visible_replay_p2, self.settings_replay_2)
 
-        self.settings_replay_1.apply_dc_center(visible_values)
-        
-        cur_t = self.replay_data[self.replay_index].get('t', 0)
+        if center_count:
+            self.settings_replay_1.center_on_value(center_total / center_count)
+
+        cur_t = float(self.replay_t[self.replay_index])
         
         # Update replay FFT if available
         if self.replay_fft_data:
-            best_frame = None
-            for frame in self.replay_fft_data:
-                if frame['t'] > cur_t:
-                    break
-                best_frame = frame
-                
-            if best_frame and 'data' in best_frame:
+            idx = int(np.searchsorted(self._replay_fft_t, cur_t, side='right')) - 1
+            best_frame = self.replay_fft_data[idx] if idx >= 0 else None
+
+            # FFT frames are far sparser than playback ticks; skip the
+            # redraw while the same frame stays current
+            if idx == self._last_replay_fft_idx:
+                pass
+            elif best_frame and 'data' in best_frame:
                 fft_vals = best_frame['data']
                 sample_rate = self.spin_fft_rate.value()
                 num_bins = len(fft_vals)
                 
                 # Calculate frequency bins dynamically (must match FFT processing)
                 # Arduino sends FFT_SAMPLES/2 bins from FFT_SAMPLES-point FFT
-                fft_size = num_bins * 2
-                freq_resolution = sample_rate / fft_size
-                freqs = np.arange(num_bins) * freq_resolution
-                mags = np.array(fft_vals)
+                freq_resolution = sample_rate / (num_bins * 2)
+                freqs = self._get_freq_axis(sample_rate, num_bins)
+                mags = np.asarray(fft_vals, dtype=np.float32)
                 
-                # Update bar graph
-                self.curve_replay_fft.setOpts(x=freqs, height=mags, width=freq_resolution * 0.8)
+                # Bin edges for the stepped curve (one more than bins)
+                edges = np.append(freqs - 0.5 * freq_resolution,
+                                  freqs[-1] + 0.5 * freq_resolution)
+                self.curve_replay_fft.setData(edges, mags)
                 
                 # Set x-axis range to show all bins
                 self.plot_replay_fft.setXRange(freqs[0] - freq_resolution, freqs[-1] + freq_resolution, padding=0.02)
                 
-                # Update x-axis ticks
-                if num_bins <= 20:
-                    tick_indices = range(num_bins)
-                else:
-                    step = max(1, num_bins // 20)
-                    tick_indices = range(0, num_bins, step)
-                
-                # Major ticks with frequency labels
-                major_ticks = [(freqs[i], f"{freqs[i]:.1f}") for i in tick_indices]
-                # Minor ticks for all bins
-                minor_ticks = [(freqs[i], "") for i in range(num_bins) if i not in tick_indices]
-                
-                self.plot_replay_fft.getAxis('bottom').setTicks([major_ticks, minor_ticks])
+                # Cached tick lists (no landmark frequencies on replay,
+                # matching the previous layout)
+                self.plot_replay_fft.getAxis('bottom').setTicks(
+                    self._get_fft_ticks(freqs, freq_resolution,
+                                        include_important=False))
             else:
-                self.curve_replay_fft.setOpts(x=[], height=[])
+                self.curve_replay_fft.clear()
+            self._last_replay_fft_idx = idx
         else:
-            self.curve_replay_fft.setOpts(x=[], height=[])
+            # No device FFT frames in this recording: fall back to a
+            # host-side spectrum of the current window
+            self._update_replay_host_fft(start_idx, end_idx)
         
         self.lbl_replay_time.setText(f"{cur_t:.2f} ms")
         
-        if t:
-            self.plot_replay_1.setXRange(min(t), max(t) + 0.1, padding=0)
+        if len(t):
+            t_min, t_max = float(t[0]), float(t[-1])
+            self.plot_replay_1.setXRange(t_min, t_max + 0.1, padding=0)
             if hasattr(self, 'plot_replay_2') and self.plot_replay_2.isVisible():
-                self.plot_replay_2.setXRange(min(t), max(t) + 0.1, padding=0)
+                self.plot_replay_2.setXRange(t_min, t_max + 0.1, padding=0)
 
     def import_data(self):
         path, _ = QFileDialog.getOpenFileName(self, "Import Data", "", "CSV Files (*.csv);;JSON Files (*.json)")
@@ -2441,32 +3152,52 @@ class AdaptiveGripperGUI(QMainWindow):
 
         try:
             for k in self.data:
-                self.data[k] = []
+                self.data[k].clear()
             self.recorded_events = []
             
             if path.endswith('.csv'):
-                with open(path, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        try:
-                            t = float(row.get('timestamp', 0))
-                            lbl = row.get('label', '')
-                            
-                            row_mapped = row.copy()
-                            if 'mx' in row: row_mapped['mlx'] = row['mx']
-                            if 'my' in row: row_mapped['mly'] = row['my']
-                            if 'mz' in row: row_mapped['mlz'] = row['mz']
+                with open(path, 'r', newline='') as f:
+                    header = next(csv.reader(f), None)
+                if not header:
+                    raise ValueError("Empty CSV file")
+
+                rename = {'mx': 'mlx', 'my': 'mly', 'mz': 'mlz'}
+                names = [rename.get(h.strip(), h.strip()) for h in header]
+                num_cols = [i for i, nm in enumerate(names) if nm != 'label']
+
+                # Same C-level parse as the replay loader: blanks and
+                # garbage become 0.0 rather than a try/except per cell
+                arr = np.genfromtxt(path, delimiter=',', skip_header=1,
+                                    usecols=num_cols, filling_values=0.0,
+                                    invalid_raise=False)
+                arr = np.nan_to_num(np.atleast_2d(arr), copy=False)
+                n = arr.shape[0]
+
+                num_names = [names[i] for i in num_cols]
+                col = {nm: arr[:, i] for i, nm in enumerate(num_names)}
+                ts = col.get('timestamp', np.zeros(n))
+
+                for k in ['mlx', 'mly', 'mlz', 'mag', 'mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz', 'cur', 'slip', 's_ind', 'srv', 'grp']:
+                    self.data[k].extend(col[k] if k in col
+                                        else np.zeros(n, dtype=np.float32))
+                self.data['timestamp'].extend(ts)
+                if 'recv_ts' in col:
+                    self.data['recv_ts'].extend(col['recv_ts'])
+
+                if 'label' in names:
+                    lcol = names.index('label')
+                    with open(path, 'r', newline='') as f:
+                        reader = csv.reader(f)
+                        next(reader, None)
+                        for i, row in enumerate(reader):
+                            if lcol < len(row) and row[lcol] and i < n:
+                                self.recorded_events.append(
+                                    {'timestamp': float(ts[i]), 'label': row[lcol]})
+
+                self._data_rev += n
+                self._dirty = True
+
 
-                            for k in ['mlx', 'mly', 'mlz', 'mag', 'mhx', 'mhy', 'mhz', 'rmx', 'rmy', 'rmz', 'cur', 'slip', 's_ind', 'srv', 'grp']:
-                                self.data[k].append(float(row_mapped.get(k, 0)))
-                            
-                            self.data['timestamp'].append(t)
-                            
-                            if lbl:
-                                self.recorded_events.append({'timestamp': t, 'label': lbl})
-                        except ValueError:
-                            continue
-                            
             elif path.endswith('.json'):
                 with open(path, 'r') as f:
                     content = json.load(f)